@@ -2,7 +2,6 @@
 Minimal parser required to bootstrap entire bootpeg parser
 """
 
-import string
 import importlib.resources
 
 from .clauses import (
@@ -92,7 +91,8 @@ boot_parser: Parser[str, Grammar] = Parser(
         ),
     ),
     Rule(
-        "identifier", Repeat(Choice(*(Value(ch) for ch in string.ascii_letters + "_")))
+        "identifier",
+        Repeat(Choice(Range("a", "z"), Range("A", "Z"), Value("_"))),
     ),
     Rule(
         "literal",
@@ -2,6 +2,7 @@
 Matching of clauses based on interpretation
 """
 
+import sys
 from typing import (
     Mapping,
     MutableMapping,
@@ -12,10 +13,12 @@ from typing import (
     Optional,
     Callable,
     Set,
+    List,
 )
 from typing_extensions import Protocol
 
-from functools import singledispatch
+from functools import singledispatch, lru_cache
+from types import CodeType
 
 from ..typing import D, D_contra
 from .clauses import (
@@ -95,10 +98,11 @@ def _(clause: Union[Sequence, Entail]) -> Set[str]:
 def _(clause: Choice) -> Set[str]:
     clause_captures = discover_captures(clause.sub_clauses[0])
     for sub_clause in clause.sub_clauses[1:]:
-        unique_captures = clause_captures ^ discover_captures(sub_clause)
-        if unique_captures:
-            raise Value(
-                f"Names {', '.join(unique_captures)} not captured "
+        sub_captures = discover_captures(sub_clause)
+        if sub_captures != clause_captures:
+            unique_captures = clause_captures ^ sub_captures
+            raise ValueError(
+                f"Names {', '.join(sorted(unique_captures))} not captured "
                 f"in all choices of {clause!r}"
             )
     return clause_captures
@@ -114,12 +118,42 @@ def _(clause: Capture) -> Set[str]:
     return {clause.name}
 
 
+@singledispatch
+def discover_prefix(clause: Clause) -> Optional[Union[str, bytes]]:
+    """The first item any match of ``clause`` must start with, if known"""
+    return None
+
+
+@discover_prefix.register(Value)
+def _(clause: Value) -> Optional[Union[str, bytes]]:
+    value = clause.value
+    return value[:1] if isinstance(value, (str, bytes)) and value else None
+
+
+@discover_prefix.register(Sequence)
+def _(clause: Sequence) -> Optional[Union[str, bytes]]:
+    return discover_prefix(clause.sub_clauses[0])
+
+
+@discover_prefix.register(Repeat)
+@discover_prefix.register(And)
+@discover_prefix.register(Capture)
+@discover_prefix.register(Transform)
+def _(clause: Union[Repeat, And, Capture, Transform]) -> Optional[Union[str, bytes]]:
+    return discover_prefix(clause.sub_clause)
+
+
+@lru_cache(maxsize=1024)
+def _compile_transform(source: str) -> CodeType:
+    """Compile the ``source`` of a transform, reusing code of identical transforms"""
+    return compile(source, source, "eval")
+
+
 def py_transform(clause: Transform, _globals: dict) -> Callable:
     """Create a ``lambda`` to execute a transform given some globals"""
-    captures = discover_captures(clause.sub_clause)
+    captures = sorted(discover_captures(clause.sub_clause))
     source = f"lambda {', '.join(captures)}: {clause.action.strip()}"
-    code = compile(source, source, "eval")
-    return eval(code, _globals)
+    return eval(_compile_transform(source), _globals)
 
 
 class Match(NamedTuple):
@@ -149,6 +183,8 @@ class Match(NamedTuple):
 
 
 Memo = MutableMapping[Tuple[int, str], Optional[Match]]
+#: marker for memo entries that were never looked up
+unknown: AnyT = object()
 Rules = Mapping[str, "MatchClause"]
 
 
@@ -162,15 +198,34 @@ def match_clause(clause: Clause[D], _globals: dict) -> MatchClause[D]:
     raise NotImplementedError(f"match_clause for type({clause!r})")
 
 
+#: input types that may use in-place methods such as ``startswith`` and ``find``
+#: instead of slicing – other domains only promise the :py:class:`~.Domain` protocol
+text_types = (str, bytes)
+
+
 @match_clause.register(Value)
 def _(clause: Value[D], _globals: dict) -> MatchClause[D]:
     value = clause.value
     length = len(value)
 
-    def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
-        if of[at : at + length] == value:
-            return Match(at, length)
-        raise MatchFailure(at, clause) from None
+    if type(value) in text_types:
+        value_type = type(value)
+
+        # compare in-place instead of slicing a candidate from the source
+        def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
+            if type(of) is value_type:
+                if of.startswith(value, at):
+                    return Match(at, length)
+            elif of[at : at + length] == value:
+                return Match(at, length)
+            raise MatchFailure(at, clause) from None
+
+    else:
+
+        def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
+            if of[at : at + length] == value:
+                return Match(at, length)
+            raise MatchFailure(at, clause) from None
 
     return do_match
 
@@ -181,11 +236,20 @@ def _(clause: Range[D], _globals: dict) -> MatchClause[D]:
     upper = clause.upper
     length = len(lower)
 
-    def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
-        candidate = of[at : at + length]
-        if len(candidate) == length and lower <= candidate <= upper:
-            return Match(at, length)
-        raise MatchFailure(at, clause) from None
+    if isinstance(lower, str) and length == 1:
+        # compare single characters directly instead of slicing a candidate
+        def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
+            if at < len(of) and lower <= of[at] <= upper:
+                return Match(at, 1)
+            raise MatchFailure(at, clause) from None
+
+    else:
+
+        def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
+            candidate = of[at : at + length]
+            if len(candidate) == length and lower <= candidate <= upper:
+                return Match(at, length)
+            raise MatchFailure(at, clause) from None
 
     return do_match
 
@@ -210,33 +274,42 @@ def _(clause: Any[D], _globals: dict) -> MatchClause[D]:
     return do_match
 
 
+def match_all(
+    do_matches: Tuple[MatchClause[D], ...], of: D, at: int, memo: Memo, rules: Rules
+) -> Match:
+    """Match all of ``do_matches`` in order, joining them into one adjacent match"""
+    results: List[AnyT] = []
+    captures: List[Tuple[str, AnyT]] = []
+    end = at
+    for do_match in do_matches:
+        match = do_match(of, end, memo, rules)
+        results.extend(match.results)
+        captures.extend(match.captures)
+        end = match.end
+    return Match(at, end - at, tuple(results), tuple(captures))
+
+
 @match_clause.register(Sequence)
 def _(clause: Sequence[D], _globals: dict) -> MatchClause[D]:
-    head_do_match, *sub_do_matches = (
+    sub_do_matches = tuple(
         match_clause(sub_clause, _globals) for sub_clause in clause.sub_clauses
     )
 
     def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
-        match = head_do_match(of, at, memo, rules)
-        for sub_do_match in sub_do_matches:
-            match += sub_do_match(of, match.end, memo, rules)
-        return match
+        return match_all(sub_do_matches, of, at, memo, rules)
 
     return do_match
 
 
 @match_clause.register(Entail)
 def _(clause: Entail[D], _globals: dict) -> MatchClause[D]:
-    head_do_match, *sub_do_matches = (
+    sub_do_matches = tuple(
         match_clause(sub_clause, _globals) for sub_clause in clause.sub_clauses
     )
 
     def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
         try:
-            match = head_do_match(of, at, memo, rules)
-            for sub_do_match in sub_do_matches:
-                match += sub_do_match(of, match.end, memo, rules)
-            return match
+            return match_all(sub_do_matches, of, at, memo, rules)
         except MatchFailure as mf:
             raise FatalMatchFailure(mf.at, mf.clause) from mf
 
@@ -248,9 +321,41 @@ def _(clause: Choice[D], _globals: dict) -> MatchClause[D]:
     match_sub_clauses = tuple(
         match_clause(sub_clause, _globals) for sub_clause in clause.sub_clauses
     )
+    prefixes = tuple(map(discover_prefix, clause.sub_clauses))
+    if sum(prefix is not None for prefix in prefixes) < 2:
+
+        def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
+            for match_sub_clause in match_sub_clauses:
+                try:
+                    return match_sub_clause(of, at, memo, rules)
+                except MatchFailure:
+                    pass
+            raise MatchFailure(at, clause)
+
+        return do_match
+    # Only try the cases that may start with the next item of the input.
+    # Cases without a known prefix are candidates for any input.
+    candidates = {
+        head: tuple(
+            match_sub_clauses[index]
+            for index, prefix in enumerate(prefixes)
+            if prefix is None or prefix == head
+        )
+        for head in prefixes
+        if head is not None
+    }
+    fallback = tuple(
+        match_sub_clauses[index]
+        for index, prefix in enumerate(prefixes)
+        if prefix is None
+    )
 
     def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
-        for match_sub_clause in match_sub_clauses:
+        if type(of) in text_types:
+            cases = candidates.get(of[at : at + 1], fallback)
+        else:
+            cases = match_sub_clauses
+        for match_sub_clause in cases:
             try:
                 return match_sub_clause(of, at, memo, rules)
             except MatchFailure:
@@ -260,19 +365,67 @@ def _(clause: Choice[D], _globals: dict) -> MatchClause[D]:
     return do_match
 
 
+def discover_stops(clause: Clause) -> Optional[Tuple[str, ...]]:
+    """
+    The stop literals if ``clause`` is a scan of the form ``!stop1 !stop2 ... .``
+
+    Repeating such a clause consumes everything up to the first stop literal,
+    which can be found without matching each item individually.
+    """
+    if not isinstance(clause, Sequence) or len(clause.sub_clauses) < 2:
+        return None
+    *guards, step = clause.sub_clauses
+    if not isinstance(step, Any) or step.length != 1:
+        return None
+    stops = []
+    for guard in guards:
+        if not isinstance(guard, Not) or not isinstance(guard.sub_clause, Value):
+            return None
+        stop = guard.sub_clause.value
+        if not isinstance(stop, str) or not stop:
+            return None
+        stops.append(stop)
+    return tuple(stops)
+
+
 @match_clause.register(Repeat)
 def _(clause: Repeat[D], _globals: dict) -> MatchClause[D]:
     match_sub_clause = match_clause(clause.sub_clause, _globals)
 
     def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
         match = match_sub_clause(of, at, memo, rules)
-        while at < match.end < len(of):
-            at = match.end
+        start, end = at, match.end
+        results = [*match.results]
+        captures = [*match.captures]
+        while at < end < len(of):
+            at = end
             try:
-                match += match_sub_clause(of, at, memo, rules)
+                match = match_sub_clause(of, at, memo, rules)
             except MatchFailure:
                 break
-        return match
+            results.extend(match.results)
+            captures.extend(match.captures)
+            end = match.end
+        return Match(start, end - start, tuple(results), tuple(captures))
+
+    stops = discover_stops(clause.sub_clause)
+    if stops is None:
+        return do_match
+    match_items = do_match
+
+    def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
+        # stops are str literals, other input must be matched individually
+        if type(of) is not str:
+            return match_items(of, at, memo, rules)
+        end = len(of)
+        for stop in stops:
+            index = of.find(stop, at)
+            if -1 < index < end:
+                end = index
+        if end > at:
+            return Match(at, end - at)
+        # nothing to consume – match individually to report the failure
+        return match_items(of, at, memo, rules)
 
     return do_match
 
@@ -306,20 +459,20 @@ def _(clause: And[D], _globals: dict) -> MatchClause[D]:
 @match_clause.register(Capture)
 def _(clause: Capture[D], _globals: dict) -> MatchClause[D]:
     match_sub_clause = match_clause(clause.sub_clause, _globals)
-    name = clause.name
+    # transforms receive captures as keywords, which match fastest by identity
+    name = sys.intern(clause.name)
     variadic = clause.variadic
 
     def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
-        match = match_sub_clause(of, at, memo, rules)
-        results = match.results
+        match_at, length, results, _ = match_sub_clause(of, at, memo, rules)
         if variadic:
-            return Match(match.at, match.length, captures=((name, results),))
-        elif not match.results:
+            return Match(match_at, length, captures=((name, results),))
+        elif not results:
             return Match(
-                match.at, match.length, captures=((name, of[match.at : match.end]),)
+                match_at, length, captures=((name, of[match_at : match_at + length]),)
             )
         elif len(results) == 1:
-            return Match(match.at, match.length, captures=((name, results[0]),))
+            return Match(match_at, length, captures=((name, results[0]),))
         else:
             raise MatchFailure(at, clause)
 
@@ -332,12 +485,12 @@ def _(clause: Transform[D], _globals: dict) -> MatchClause[D]:
     py_call = py_transform(clause, _globals)
 
     def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
-        match = match_sub_clause(of, at, memo, rules)
+        match_at, length, _, captures = match_sub_clause(of, at, memo, rules)
         try:
-            result = py_call(**dict(match.captures))
+            result = py_call(**dict(captures))
         except Exception as err:
             raise FatalMatchFailure(at, clause) from err
-        return Match(match.at, match.length, results=(result,))
+        return Match(match_at, length, results=(result,))
 
     return do_match
 
@@ -348,28 +501,26 @@ def _(clause: Reference[D], _globals: dict) -> MatchClause[D]:
 
     # Adapted from Medeiros et al.
     def do_match(of: D, at: int, memo: Memo, rules: Rules) -> Match:
-        try:
-            child_match = memo[at, name]
-        except KeyError:
-            # mark this Rule as unmatched ...
-            match = memo[at, name] = None
-            old_end = at - 1
-            # ... then iteratively expand the match
-            while True:
-                try:
-                    new_match = rules[name](of, at, memo, rules)
-                except (MatchFailure, FatalMatchFailure) as mf:
-                    raise type(mf)(at, clause) from mf  # raise for rule to record path
-                if new_match.end > old_end:
-                    match = memo[at, name] = new_match
-                    old_end = new_match.end
-                else:
-                    assert match is not None
-                    return match
-        else:
-            if child_match is None:
-                raise MatchFailure(at, clause)
+        key = at, name
+        child_match = memo.get(key, unknown)
+        if child_match is None:
+            raise MatchFailure(at, clause)
+        elif child_match is not unknown:
+            return child_match
+        # mark this Rule as unmatched ...
+        match = memo[key] = None
+        old_end = at - 1
+        # ... then iteratively expand the match
+        while True:
+            try:
+                new_match = rules[name](of, at, memo, rules)
+            except (MatchFailure, FatalMatchFailure) as mf:
+                raise type(mf)(at, clause) from mf  # raise for rule to record path
+            if new_match.end > old_end:
+                match = memo[key] = new_match
+                old_end = new_match.end
             else:
-                return child_match
+                assert match is not None
+                return match
 
     return do_match
@@ -0,0 +1,200 @@
+"""
+Dialect independent formatting of clauses
+
+Each dialect provides a :py:class:`Style` describing its tokens;
+the generic :py:func:`unparse` turns clauses into text using this style.
+"""
+
+from typing import Union, Callable, Mapping, Type
+from functools import singledispatch
+
+from ..apegs.boot import (
+    Value,
+    Range,
+    Any,
+    Empty,
+    Sequence,
+    Choice,
+    Repeat,
+    And,
+    Not,
+    Entail,
+    Capture,
+    Transform,
+    Reference,
+    Rule,
+    Clause,
+    Parser,
+    Grammar,
+)
+
+
+class Style:
+    """
+    The tokens and formatting rules by which a dialect represents clauses
+
+    :param name: name of the dialect, used in error messages
+    :param precedence: binding strength of each clause type, lower binds tighter
+    :param literal: formatter for the value of a :py:class:`Value`
+    :param range_format: formatter for the bounds of a :py:class:`Range`
+    :param choice_sep: separator between the cases of a :py:class:`Choice`
+    :param optional_brackets: whether to format ``Choice(..., Empty())`` as ``[...]``
+    :param rule_head: suffix of the rule name, e.g. ``":"`` for ``name:``
+    :param rule_bar: prefix of each rule case, e.g. ``"|"`` for ``| case``
+    :param inline_rule: whether a rule with a single case fits on one line
+    """
+
+    __slots__ = (
+        "name",
+        "precedence",
+        "literal",
+        "range_format",
+        "choice_sep",
+        "optional_brackets",
+        "rule_head",
+        "rule_bar",
+        "inline_rule",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        precedence: Mapping[Type[Clause], int],
+        literal: Callable[[str], str],
+        range_format: Callable[[str, str], str],
+        choice_sep: str,
+        optional_brackets: bool,
+        rule_head: str,
+        rule_bar: str,
+        inline_rule: bool,
+    ):
+        self.name = name
+        self.precedence = precedence
+        self.literal = literal
+        self.range_format = range_format
+        self.choice_sep = choice_sep
+        self.optional_brackets = optional_brackets
+        self.rule_head = rule_head
+        self.rule_bar = rule_bar
+        self.inline_rule = inline_rule
+
+
+def _wrapped(clause: Clause, parent: Clause, style: Style) -> str:
+    literal = unparse(clause, style)
+    precedence = style.precedence
+    if (
+        style.optional_brackets
+        and literal[0] == "["
+        or precedence[type(parent)] >= precedence[type(clause)]
+    ):
+        return literal
+    else:
+        return f"({literal})"
+
+
+@singledispatch
+def unparse(clause: Union[Clause, Parser, Grammar], style: Style) -> str:
+    """Format a ``clause`` according to a dialect ``style``"""
+    raise NotImplementedError(f"Cannot unparse {clause!r} as {style.name}")
+
+
+@unparse.register(Parser)
+@unparse.register(Grammar)
+def unparse_grammar(clause: Union[Parser, Grammar], style: Style) -> str:
+    return "\n\n".join(unparse(rule, style) for rule in clause.rules)
+
+
+@unparse.register(Value)
+def unparse_literal(clause: Value, style: Style) -> str:
+    return style.literal(clause.value)
+
+
+@unparse.register(Range)
+def unparse_range(clause: Range, style: Style) -> str:
+    return style.range_format(clause.lower, clause.upper)
+
+
+@unparse.register(Empty)
+def unparse_empty(clause: Empty, style: Style) -> str:
+    return '""'
+
+
+@unparse.register(Any)
+def unparse_any(clause: Any, style: Style) -> str:
+    return "." * clause.length
+
+
+@unparse.register(Reference)
+def unparse_reference(clause: Reference, style: Style) -> str:
+    return clause.name
+
+
+@unparse.register(Sequence)
+def unparse_sequence(clause: Sequence, style: Style) -> str:
+    return " ".join(
+        _wrapped(sub_clause, clause, style) for sub_clause in clause.sub_clauses
+    )
+
+
+@unparse.register(Entail)
+def unparse_entail(clause: Entail, style: Style) -> str:
+    return "~ " + " ".join(
+        _wrapped(sub_clause, clause, style) for sub_clause in clause.sub_clauses
+    )
+
+
+@unparse.register(Choice)
+def unparse_choice(clause: Choice, style: Style) -> str:
+    separator = f" {style.choice_sep} "
+    if style.optional_brackets and isinstance(clause.sub_clauses[-1], Empty):
+        return (
+            "["
+            + separator.join(
+                _wrapped(sub_clause, clause, style)
+                for sub_clause in clause.sub_clauses[:-1]
+            )
+            + "]"
+        )
+    return separator.join(
+        _wrapped(sub_clause, clause, style) for sub_clause in clause.sub_clauses
+    )
+
+
+@unparse.register(Repeat)
+def unparse_repeat(clause: Repeat, style: Style) -> str:
+    return _wrapped(clause.sub_clause, clause, style) + "+"
+
+
+@unparse.register(Not)
+def unparse_not(clause: Not, style: Style) -> str:
+    return "!" + _wrapped(clause.sub_clause, clause, style)
+
+
+@unparse.register(And)
+def unparse_and(clause: And, style: Style) -> str:
+    return "&" + _wrapped(clause.sub_clause, clause, style)
+
+
+@unparse.register(Capture)
+def unparse_capture(clause: Capture, style: Style) -> str:
+    var = "*" if clause.variadic else ""
+    return var + clause.name + "=" + _wrapped(clause.sub_clause, clause, style)
+
+
+@unparse.register(Transform)
+def unparse_transform(clause: Transform, style: Style) -> str:
+    return f"{_wrapped(clause.sub_clause, clause, style)} {{{clause.action}}}"
+
+
+@unparse.register(Rule)
+def unparse_rule(clause: Rule, style: Style) -> str:
+    sub_clause = clause.sub_clause
+    head = clause.name + style.rule_head
+    if isinstance(sub_clause, Choice):
+        cases = sub_clause.sub_clauses
+    elif style.inline_rule:
+        return f"{head} {unparse(sub_clause, style)}"
+    else:
+        cases = (sub_clause,)
+    body = "\n".join(f"    {style.rule_bar} {unparse(case, style)}" for case in cases)
+    return f"{head}\n{body}"
@@ -1,6 +1,9 @@
-from typing import Tuple, TypeVar, Type
+from typing import Tuple, TypeVar, Type, Callable
+from operator import attrgetter
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def grammar_resource(location: str) -> Tuple[str, str]:
     """
     Given a module-like location, return the package and resource of a grammar
@@ -17,6 +20,16 @@ def grammar_resource(location: str) -> Tuple[str, str]:
 T = TypeVar("T")
 
 
+def _members(slots: Tuple[str, ...]) -> Callable[[object], tuple]:
+    """Create a callable to fetch the values of ``slots`` from an object as a tuple"""
+    if len(slots) > 1:
+        return attrgetter(*slots)
+    elif slots:
+        (name,) = slots
+        return lambda obj: (getattr(obj, name),)
+    return lambda obj: ()
+
+
 def slotted(cls: Type[T]) -> Type[T]:
     """
     Class decorator to add ``__repr__``, ``__eq__`` and ``__hash__`` from ``__slots__``
@@ -29,18 +42,21 @@ def slotted(cls: Type[T]) -> Type[T]:
             for name in getattr(scls, "__slots__", ())
         }
     )
+    type_hash = hash(cls)
+    get_members = _members(slots)
+
+    template = "{}(" + ", ".join(f"{name}={{!r}}" for name in slots) + ")"
 
     def __repr__(self: T):
-        members = ", ".join(f"{name}={getattr(self, name)!r}" for name in slots)
-        return f"{self.__class__.__name__}({members})"
+        return template.format(self.__class__.__name__, *get_members(self))
 
     def __eq__(self: T, other) -> bool:
-        return isinstance(other, type(self)) and all(
-            getattr(self, name) == getattr(other, name) for name in slots
+        return self is other or (
+            isinstance(other, type(self)) and get_members(self) == get_members(other)
         )
 
     def __hash__(self: T) -> int:
-        return hash((*(getattr(self, name) for name in slots), hash(type(self))))
+        return hash((get_members(self), type_hash))
 
     cls.__repr__ = __repr__
     cls.__eq__ = __eq__
@@ -2,6 +2,7 @@
 `bootpeg` example interpreter emulating Rational math via Integer math
 """
 from typing import NamedTuple
+from math import gcd
 import sys
 
 from bootpeg.grammars import bpeg
@@ -31,21 +32,21 @@ class Rational(NamedTuple):
         )
 
 
-def gcd(a, b):
-    """The greatest common divisor of ``a`` and ``b``"""
-    # Euclidean algorithm
-    while b > 0:
-        b, a = a % b, b
-    return a
+#: shared instances of the common results 0 and 1
+_zero_one = (Rational(False, 0, 1), Rational(False, 1, 1))
 
 
 def fraction(numerator: int, denominator: int) -> Rational:
     """Construct an optimal Rational from separate numerator and denominator"""
-    negative = True if (numerator < 0) ^ (denominator < 0) else False
-    numerator = abs(numerator)
-    denominator = abs(denominator)
     divisor = gcd(numerator, denominator)
-    return Rational(negative, numerator // divisor, denominator // divisor)
+    numerator, denominator = numerator // divisor, denominator // divisor
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    if numerator < 0:
+        return Rational(True, -numerator, denominator)
+    elif denominator == 1 and numerator <= 1:
+        return _zero_one[numerator]
+    return Rational(False, numerator, denominator)
 
 
 # Mathematical operations
@@ -56,9 +57,10 @@ def neg(of: Rational):
 
 def add(lhs: Rational, rhs: Rational):
     """Binary addition"""
+    lhs_numerator = -lhs.numerator if lhs.negative else lhs.numerator
+    rhs_numerator = -rhs.numerator if rhs.negative else rhs.numerator
     return fraction(
-        lhs.sign * lhs.numerator * rhs.denominator
-        + rhs.sign * rhs.numerator * lhs.denominator,
+        lhs_numerator * rhs.denominator + rhs_numerator * lhs.denominator,
         lhs.denominator * rhs.denominator,
     )
 
@@ -95,13 +97,14 @@ def parse_decimal(literal: str) -> Rational:
     """Parse a literal decimal, such as ``12.3``"""
     assert "." in literal
     dot_index = literal.find(".")
-    numerator = int(literal[:dot_index] + literal[dot_index + 1 :])
+    numerator = int(literal.replace(".", "", 1))
     return fraction(numerator, 10 ** (len(literal) - dot_index - 1))
 
 
 def parse_integer(literal: str) -> Rational:
     """Parse a literal integer, such as ``12``"""
-    return Rational(False, int(literal), 1)
+    value = int(literal)
+    return _zero_one[value] if value <= 1 else Rational(False, value, 1)
 
 
 # actions expected by the grammar
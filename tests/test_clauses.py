@@ -0,0 +1,63 @@
+import pytest
+
+from bootpeg.apegs import (
+    Value,
+    Range,
+    Any,
+    Empty,
+    Sequence,
+    Choice,
+    Repeat,
+    And,
+    Not,
+    Entail,
+    Capture,
+    Transform,
+    Reference,
+    Rule,
+    Parser,
+)
+
+
+clauses = [
+    Value("a"),
+    Range("a", "b"),
+    Any(1),
+    Empty(),
+    Sequence(Value("a"), Value("b")),
+    Choice(Value("a"), Value("b")),
+    Repeat(Value("a")),
+    And(Value("a")),
+    Not(Value("a")),
+    Entail(Value("a")),
+    Capture(Value("a"), "name", False),
+    Transform(Value("a"), "True"),
+    Reference("a"),
+    Rule("a", Value("a")),
+]
+
+
+@pytest.mark.parametrize("clause", clauses, ids=lambda clause: type(clause).__name__)
+def test_slotted(clause):
+    """Ensure that clauses only store their fields in slots"""
+    assert not hasattr(clause, "__dict__")
+
+
+sequence_inputs = [
+    (Choice(Value("a"), Any(1)), ("x",)),
+    (Choice(Value("a"), Any(1)), ["x"]),
+    (Choice(Value("a"), Any(1)), b"x"),
+    (Choice(Value("a"), Value("b"), Any(1)), ("x",)),
+    (Choice(Value("a"), Value("b"), Any(1)), ["x"]),
+    (Choice(Value("a"), Value("b"), Any(1)), b"x"),
+    (Repeat(Sequence(Not(Value("a")), Any(1))), ("x", "y")),
+    (Repeat(Sequence(Not(Value("a")), Any(1))), ["x", "y"]),
+    (Repeat(Sequence(Not(Value("a")), Any(1))), b"xy"),
+]
+
+
+@pytest.mark.parametrize("clause, source", sequence_inputs)
+def test_sequence_input(clause, source):
+    """Ensure that clauses match any sequence input, not just ``str``"""
+    parser = Parser(Rule("top", Transform(clause, "1")))
+    assert parser(source) == 1
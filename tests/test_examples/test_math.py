@@ -36,3 +36,11 @@ math_expressions = [
 def test_parsing(expression, expected):
     result = math.interpret(expression)
     assert result == expected
+
+
+def test_shared_results():
+    """Test that shared results such as ``1`` cannot be modified"""
+    one = math.interpret("1")
+    with pytest.raises(AttributeError):
+        one.numerator = 7
+    assert math.interpret("3-2") == math.Rational(False, 1, 1)
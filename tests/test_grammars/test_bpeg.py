@@ -84,6 +84,35 @@ def test_not_anything():
         not_anything_parse("bb")
 
 
+@pytest.mark.parametrize("source", ["ab", "a", "b", "x"])
+def test_choice_prefix(source):
+    """Test that choices keep their order when skipping cases by prefix"""
+    choice_parse = create_parser(
+        'top:\n    | a=("ab" | "a" | "b" | other) !. { a }\nother:\n    | .\n', bpeg
+    )
+    assert choice_parse(source) == source
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [("abyzc", ("ab", "yzc")), ("aby", ("aby", "")), ("ayxz", ("ay", "xz"))],
+)
+def test_scan_stops(source, expected):
+    """Test that scanning up to one of several stop literals matches like items"""
+    scan_parse = create_parser(
+        'top:\n    | head=(!"x" !"yz" .)+ tail=(.*) { (head, tail) }\n', bpeg
+    )
+    assert scan_parse(source) == expected
+    with pytest.raises(ParseFailure):
+        scan_parse("x" + source)
+
+
+def test_choice_captures():
+    """Test that all cases of a choice must capture the same names"""
+    with pytest.raises(ValueError):
+        create_parser('top:\n    | (a="a" | b="b") { True }\n', bpeg)
+
+
 def test_unparse():
     """Test that unparsing produces valid grammars"""
     parser = bpeg.parse
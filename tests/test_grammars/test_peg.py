@@ -1,5 +1,3 @@
-import sys
-
 import pytest
 
 from bootpeg import create_parser, actions
@@ -53,8 +51,6 @@ def test_roundtrip(clause):
     assert parsed_rule.sub_clause == clause
 
 
-sys.setrecursionlimit(30000)
-
 # Adapted from PEG paper
 # Some fixes due to errors in the original grammar
 peg_grammar = r"""
@@ -104,15 +100,25 @@ EndOfFile <- !.
 """
 
 
-def test_parse_reference():
-    """Parse the PEG reference grammar"""
+@pytest.fixture(scope="module")
+def reference_parser() -> Parser:
+    """Parser created from the PEG reference grammar"""
     parse = create_parser(peg_grammar, dialect=peg)
     # reference PEG does not understand results, but bootpeg requires them
-    parse = Parser(
+    return Parser(
         Rule(parse.rules[0].name, Transform(parse.rules[0].sub_clause, "()")),
         *parse.rules[1:],
     )
-    assert parse(peg_grammar) == ()
+
+
+def test_parse_reference(reference_parser):
+    """Parse the PEG reference grammar"""
+    assert reference_parser(peg_grammar) == ()
+
+
+def test_parse_reference_short(reference_parser):
+    """Parse a single-line grammar with the PEG reference grammar"""
+    assert reference_parser("""top <- ab ab <- a / b a <- "a" ab? b <- "b" ab?""") == ()
 
 
 def test_parse_short():
@@ -122,9 +128,13 @@ def test_parse_short():
 
 def test_unparse():
     """Test that unparsing produces valid grammars"""
+    peg_actions = {**actions, "unescape": peg.unescape}
     parser = peg.parse
-    for i in range(3):
-        prev_gram = peg.unparse(parser)
-        parser = create_parser(prev_gram, parser, {**actions, "unescape": peg.unescape})
-        # grammar is not optimal for peg when coming from bpeg
-        assert i == 0 or prev_gram == peg.unparse(parser)
+    prev_gram, gram = None, peg.unparse(parser)
+    # grammar is not optimal for peg when coming from bpeg
+    for _ in range(2):
+        parser = create_parser(gram, parser, peg_actions)
+        prev_gram, gram = gram, peg.unparse(parser)
+        if gram == prev_gram:
+            break
+    assert gram == prev_gram